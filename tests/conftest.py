@@ -1,5 +1,14 @@
 """Shared mock classes and fixtures for all tests."""
 
+import copy
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root for imports (once, for every test package)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
 
 class MockArtist:
     """Mock TIDAL artist object."""
@@ -396,3 +405,61 @@ class MockResponse:
 
     def json(self):
         return self._json_data
+
+
+def returning(value):
+    """Build a stub method that ignores its arguments and returns value.
+
+    Cheaper than MagicMock(return_value=...) when the test never inspects calls.
+    """
+    return lambda *args, **kwargs: value
+
+
+def raising(exc):
+    """Build a stub method that ignores its arguments and raises exc."""
+
+    def stub(*args, **kwargs):
+        raise exc
+
+    return stub
+
+
+# --- Shared mock fixtures ---
+# Prototypes are built once per session; the function-scoped fixtures hand out
+# shallow copies so tests can reassign attributes without leaking state.
+
+
+@pytest.fixture(scope="session")
+def mock_artist_proto():
+    """Default MockArtist, constructed once per session."""
+    return MockArtist()
+
+
+@pytest.fixture(scope="session")
+def mock_album_proto(mock_artist_proto):
+    """Default MockAlbum, constructed once per session."""
+    return MockAlbum(artist=mock_artist_proto)
+
+
+@pytest.fixture(scope="session")
+def mock_track_proto(mock_artist_proto, mock_album_proto):
+    """Default MockTrack, constructed once per session."""
+    return MockTrack(artist=mock_artist_proto, album=mock_album_proto)
+
+
+@pytest.fixture
+def mock_artist(mock_artist_proto):
+    """Per-test copy of the default MockArtist."""
+    return copy.copy(mock_artist_proto)
+
+
+@pytest.fixture
+def mock_album(mock_album_proto):
+    """Per-test copy of the default MockAlbum."""
+    return copy.copy(mock_album_proto)
+
+
+@pytest.fixture
+def mock_track(mock_track_proto):
+    """Per-test copy of the default MockTrack."""
+    return copy.copy(mock_track_proto)
@@ -61,3 +61,38 @@ def mock_auth_failure(mocker):
         return MockResponse({}, 404)
 
     return mocker.patch.object(mcp_utils_real.http, "get", side_effect=auth_side_effect)
+
+
+@pytest.fixture
+def captured():
+    """Empty dict that the capture_* fixtures fill with the outgoing request's url and params/json."""
+    return {}
+
+
+@pytest.fixture
+def capture_get(mock_auth_success, captured):
+    """Authenticate, then capture the url and query params of every other GET (answered with an empty 200)."""
+    auth_side_effect = mock_auth_success.side_effect
+
+    def get_side_effect(url, **kwargs):
+        if "/api/auth/status" in url:
+            return auth_side_effect(url, **kwargs)
+        captured["url"] = url
+        captured["params"] = kwargs.get("params") or {}
+        return MockResponse({})
+
+    mock_auth_success.side_effect = get_side_effect
+    return captured
+
+
+@pytest.fixture
+def capture_post(mock_auth_success, mocker, captured):
+    """Authenticate, then capture the url and JSON payload of every POST (answered with a generic success)."""
+
+    def post_side_effect(url, **kwargs):
+        captured["url"] = url
+        captured["json"] = kwargs.get("json") or {}
+        return MockResponse({"status": "success", "message": "", "added_count": 1})
+
+    mocker.patch.object(mcp_utils_real.http, "post", side_effect=post_side_effect)
+    return captured
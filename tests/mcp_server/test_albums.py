@@ -113,25 +113,14 @@ class TestGetAlbumTracks:
         assert result["status"] == "success"
         assert result["total"] == 2
 
-    def test_with_custom_limit(self, mocker):
+    def test_with_custom_limit(self, capture_get):
         """Test that limit parameter is passed through."""
-        captured_params = {}
-
-        def mock_get(url, **kwargs):
-            if "/api/auth/status" in url:
-                return MockResponse({"authenticated": True})
-            if "/tracks" in url:
-                captured_params.update(kwargs.get("params", {}))
-                return MockResponse({"album_id": "456", "tracks": [], "total": 0})
-            return MockResponse({}, 404)
-
-        mocker.patch.object(mcp_utils_real.http, "get", side_effect=mock_get)
-
         from tools.albums import get_album_tracks
 
         get_album_tracks("456", limit=10)
 
-        assert captured_params.get("limit") == 10
+        assert capture_get["url"].endswith("/api/albums/456/tracks")
+        assert capture_get["params"].get("limit") == 10
 
 
 class TestGetSimilarAlbums:
@@ -113,25 +113,14 @@ class TestGetArtistTopTracks:
         assert result["status"] == "success"
         assert result["total"] == 2
 
-    def test_with_custom_limit(self, mocker):
+    def test_with_custom_limit(self, capture_get):
         """Test that limit parameter is passed through."""
-        captured_params = {}
-
-        def mock_get(url, **kwargs):
-            if "/api/auth/status" in url:
-                return MockResponse({"authenticated": True})
-            if "/top-tracks" in url:
-                captured_params.update(kwargs.get("params", {}))
-                return MockResponse({"artist_id": "123", "tracks": [], "total": 0})
-            return MockResponse({}, 404)
-
-        mocker.patch.object(mcp_utils_real.http, "get", side_effect=mock_get)
-
         from tools.artists import get_artist_top_tracks
 
         get_artist_top_tracks("123", limit=5)
 
-        assert captured_params.get("limit") == 5
+        assert capture_get["url"].endswith("/api/artists/123/top-tracks")
+        assert capture_get["params"].get("limit") == 5
 
 
 class TestGetArtistAlbums:
@@ -172,25 +161,14 @@ class TestGetArtistAlbums:
         assert result["total"] == 1
         assert result["filter"] == "albums"
 
-    def test_with_filter(self, mocker):
+    def test_with_filter(self, capture_get):
         """Test that filter parameter is passed through."""
-        captured_params = {}
-
-        def mock_get(url, **kwargs):
-            if "/api/auth/status" in url:
-                return MockResponse({"authenticated": True})
-            if "/albums" in url:
-                captured_params.update(kwargs.get("params", {}))
-                return MockResponse({"artist_id": "123", "filter": "ep_singles", "albums": [], "total": 0})
-            return MockResponse({}, 404)
-
-        mocker.patch.object(mcp_utils_real.http, "get", side_effect=mock_get)
-
         from tools.artists import get_artist_albums
 
         get_artist_albums("123", filter="ep_singles")
 
-        assert captured_params.get("filter") == "ep_singles"
+        assert capture_get["url"].endswith("/api/artists/123/albums")
+        assert capture_get["params"].get("filter") == "ep_singles"
 
 
 class TestGetSimilarArtists:
@@ -97,28 +97,8 @@ class TestAddTracksToPlaylist:
         assert result["status"] == "error"
         assert "not found" in result["message"].lower()
 
-    def test_add_tracks_with_options(self, mocker):
+    def test_add_tracks_with_options(self, capture_post):
         """Test adding tracks with allow_duplicates and position."""
-        captured_payload = {}
-
-        def mock_get(url, **kwargs):
-            if "/api/auth/status" in url:
-                return MockResponse({"authenticated": True})
-            return MockResponse({}, 404)
-
-        def mock_post(url, **kwargs):
-            captured_payload.update(kwargs.get("json", {}))
-            return MockResponse(
-                {
-                    "status": "success",
-                    "message": "Added tracks",
-                    "added_count": 1,
-                }
-            )
-
-        mocker.patch.object(mcp_utils_real.http, "get", side_effect=mock_get)
-        mocker.patch.object(mcp_utils_real.http, "post", side_effect=mock_post)
-
         from tools.playlists import add_tracks_to_playlist
 
         result = add_tracks_to_playlist(
@@ -129,8 +109,9 @@ class TestAddTracksToPlaylist:
         )
 
         assert result["status"] == "success"
-        assert captured_payload.get("allow_duplicates") is True
-        assert captured_payload.get("position") == 5
+        assert capture_post["url"].endswith("/api/playlists/playlist-123/tracks")
+        assert capture_post["json"].get("allow_duplicates") is True
+        assert capture_post["json"].get("position") == 5
 
 
 class TestRemoveTracksFromPlaylist:
@@ -1,33 +1,95 @@
 """Flask-specific fixtures for tidal_api tests."""
 
 import sys
-from pathlib import Path
-from unittest.mock import MagicMock
+import types
+from unittest.mock import Mock
 
 import pytest
 
-# Add project root for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from tests.conftest import returning
 
-# Mock browser_session before importing app
-sys.modules["tidal_api.browser_session"] = MagicMock()
+# Stub browser_session before importing app. Routes only import BrowserSession
+# (for type hints and construction); any other attribute access should fail loudly.
+_browser_session_stub = types.ModuleType("tidal_api.browser_session")
+_browser_session_stub.BrowserSession = type("BrowserSession", (), {})
+sys.modules["tidal_api.browser_session"] = _browser_session_stub
 
+from tidal_api import utils  # noqa: E402
 from tidal_api.app import create_app  # noqa: E402
+from tidal_api.routes import auth  # noqa: E402
 
 
-@pytest.fixture
-def client():
-    """Create test client for Flask app."""
+@pytest.fixture(scope="session")
+def app():
+    """Create the Flask app once for the whole test session.
+
+    Routes read TIDAL_USE_CUSTOM_CLIENT on each request, so tests can still switch
+    modes with monkeypatch.setenv against the shared app.
+    """
     app = create_app()
     app.config["TESTING"] = True
-    with app.test_client() as client:
-        yield client
+    return app
 
 
-@pytest.fixture
-def mock_session_file(tmp_path, mocker):
-    """Create a mock session file."""
-    session_file = tmp_path / "tidal-session-oauth.json"
+@pytest.fixture(scope="session")
+def client(app):
+    """Test client shared across the session.
+
+    The API is stateless and the client keeps no cookie jar, so nothing carries
+    over between tests; per-test state lives in the function-scoped patch fixtures.
+    """
+    client = app.test_client(use_cookies=False)
+    # Compile the URL map up front so it is not billed to whichever test runs first
+    client.get("/health")
+    return client
+
+
+@pytest.fixture(scope="session")
+def session_file_path(tmp_path_factory):
+    """Write the mock session file once for the whole test session."""
+    session_file = tmp_path_factory.mktemp("tidal") / "tidal-session-oauth.json"
     session_file.write_text("{}")
-    mocker.patch("tidal_api.utils.SESSION_FILE", session_file)
     return session_file
+
+
+@pytest.fixture
+def mock_session_file(session_file_path, monkeypatch):
+    """Point SESSION_FILE at the shared mock session file (treat it as read-only)."""
+    monkeypatch.setattr(utils, "SESSION_FILE", session_file_path)
+    monkeypatch.setattr(auth, "SESSION_FILE", session_file_path)
+    return session_file_path
+
+
+@pytest.fixture
+def authed_session(mock_session_file, monkeypatch):
+    """Authenticated mock TIDAL session returned by _create_tidal_session.
+
+    Tests configure the entity lookups they need, e.g. ``authed_session.album.return_value``.
+    """
+    session = Mock()
+    session.login_session_file_auto.return_value = True
+    session._is_token_valid.return_value = True
+    monkeypatch.setattr(utils, "_create_tidal_session", returning(session))
+    return session
+
+
+@pytest.fixture
+def custom_client_session(mock_session_file, monkeypatch):
+    """Authenticated mock custom-client session with TIDAL_USE_CUSTOM_CLIENT enabled.
+
+    Like the real TidalSession it has no login_session_file_auto, so requires_tidal_auth
+    takes the _is_token_valid path.
+    """
+    monkeypatch.setenv("TIDAL_USE_CUSTOM_CLIENT", "true")
+    session = Mock()
+    del session.login_session_file_auto
+    session._is_token_valid.return_value = True
+    monkeypatch.setattr(utils, "_create_tidal_session", returning(session))
+    return session
+
+
+def get_json(client, url, expected_status=200):
+    """GET url, assert the response status and return the parsed JSON body."""
+    response = client.get(url)
+    assert response.status_code == expected_status
+    return response.get_json()
@@ -1,7 +1,43 @@
 """Tests for /api/auth Flask endpoints (dual-mode: BrowserSession + custom client)."""
 
-import json
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from tests.conftest import MockArtist, returning
+from tests.tidal_api.conftest import get_json
+from tidal_api import utils
+from tidal_api.routes import auth as auth_mod
+
+
+@pytest.fixture(autouse=True)
+def create_session(session_file_path, monkeypatch):
+    """Isolate auth tests from the real session file and session factory.
+
+    SESSION_FILE points at a missing file unless the test also requests
+    mock_session_file; set ``create_session.return_value`` to choose the session.
+    """
+    missing_file = session_file_path.with_name("missing-session.json")
+    monkeypatch.setattr(auth_mod, "SESSION_FILE", missing_file)
+    monkeypatch.setattr(utils, "SESSION_FILE", missing_file)
+    create = Mock()
+    monkeypatch.setattr(auth_mod, "_create_tidal_session", create)
+    monkeypatch.setattr(utils, "_create_tidal_session", create)
+    return create
+
+
+def _status_session(session_kind, valid, user_id=None):
+    """Build a session double for the requested client mode."""
+    if session_kind == "browser":
+        mock_session = SimpleNamespace(
+            login_session_file_auto=returning(valid),
+            user=SimpleNamespace(id=user_id, username="testuser", email="test@example.com"),
+        )
+    else:
+        # No login_session_file_auto attribute, like the real TidalSession
+        mock_session = SimpleNamespace(_is_token_valid=returning(valid), _user_id=user_id)
+    return mock_session
 
 
 class TestAuthStatus:
@@ -11,86 +47,58 @@ class TestAuthStatus:
         """Returns unauthenticated when no session file exists."""
         response = client.get("/api/auth/status")
         assert response.status_code == 200
-        data = json.loads(response.data)
-        assert data["authenticated"] is False
-        assert "No session file found" in data["message"]
-
-    def test_status_browser_session_valid(self, client, mock_session_file, mocker):
-        """BrowserSession: returns authenticated with user info when session is valid."""
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-        mock_session.user.id = 42
-        mock_session.user.username = "testuser"
-        mock_session.user.email = "test@example.com"
-        mocker.patch("tidal_api.routes.auth._create_tidal_session", return_value=mock_session)
-        mocker.patch("tidal_api.routes.auth.SESSION_FILE", mock_session_file)
-
-        response = client.get("/api/auth/status")
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        assert data["authenticated"] is True
-        assert data["user"]["id"] == 42
-        assert data["user"]["username"] == "testuser"
-
-    def test_status_browser_session_invalid(self, client, mock_session_file, mocker):
-        """BrowserSession: returns unauthenticated when session file is invalid."""
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = False
-        mocker.patch("tidal_api.routes.auth._create_tidal_session", return_value=mock_session)
-
-        response = client.get("/api/auth/status")
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        assert data["authenticated"] is False
-
-    def test_status_custom_client_valid(self, client, mock_session_file, mocker):
-        """Custom client: returns authenticated with user_id when token is valid."""
-        mock_session = MagicMock(spec=[])  # spec=[] means no attributes → no login_session_file_auto
-        mock_session._is_token_valid = MagicMock(return_value=True)
-        mock_session._user_id = "user_123"
-        mocker.patch("tidal_api.routes.auth._create_tidal_session", return_value=mock_session)
-        mocker.patch("tidal_api.routes.auth.SESSION_FILE", mock_session_file)
-
-        response = client.get("/api/auth/status")
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        assert data["authenticated"] is True
-        assert data["user"]["id"] == "user_123"
-
-    def test_status_custom_client_invalid(self, client, mock_session_file, mocker):
-        """Custom client: returns unauthenticated when token is invalid."""
-        mock_session = MagicMock(spec=[])  # No login_session_file_auto
-        mock_session._is_token_valid = MagicMock(return_value=False)
-        mocker.patch("tidal_api.routes.auth._create_tidal_session", return_value=mock_session)
-
-        response = client.get("/api/auth/status")
-        assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data["authenticated"] is False
+        assert data["message"] == "No session file found"
+
+    @pytest.mark.parametrize(
+        ("session_kind", "valid", "expected_user"),
+        [
+            pytest.param(
+                "browser",
+                True,
+                {"id": 42, "username": "testuser", "email": "test@example.com"},
+                id="browser-valid",
+            ),
+            pytest.param("browser", False, None, id="browser-invalid"),
+            pytest.param("custom", True, {"id": "user_123"}, id="custom-valid"),
+            pytest.param("custom", False, None, id="custom-invalid"),
+        ],
+    )
+    @pytest.mark.usefixtures("mock_session_file")
+    def test_status(self, client, create_session, session_kind, valid, expected_user):
+        """Reports authentication state and user info for both session kinds."""
+        user_id = expected_user["id"] if expected_user else None
+        create_session.return_value = _status_session(session_kind, valid=valid, user_id=user_id)
+
+        data = get_json(client, "/api/auth/status")
+        assert data["authenticated"] is valid
+        assert data.get("user") == expected_user
+        if not valid:
+            assert data["message"] == "Invalid or expired session"
 
 
 class TestRequiresTidalAuth:
     """Tests for requires_tidal_auth decorator with both session types."""
 
-    def test_decorator_custom_client_valid_token(self, client, mock_session_file, mocker):
-        """Custom client: route is accessible when token is valid."""
-        mock_session = MagicMock(spec=[])  # No login_session_file_auto
-        mock_session._is_token_valid = MagicMock(return_value=True)
-        mock_session.artist = MagicMock(return_value=MagicMock(id=1, name="Test", picture=None, roles=[]))
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
+    @pytest.mark.parametrize(
+        ("session_kind", "valid", "expected_status"),
+        [
+            pytest.param("browser", True, 200, id="browser-valid"),
+            pytest.param("browser", False, 401, id="browser-invalid"),
+            pytest.param("custom", True, 200, id="custom-valid"),
+            pytest.param("custom", False, 401, id="custom-invalid"),
+        ],
+    )
+    @pytest.mark.usefixtures("mock_session_file")
+    def test_decorator(self, client, create_session, session_kind, valid, expected_status):
+        """Route is reachable only when the session validates."""
+        mock_session = _status_session(session_kind, valid=valid)
+        mock_session.artist = returning(MockArtist())
+        create_session.return_value = mock_session
 
         response = client.get("/api/artists/1")
-        # Should not get a 401 - the route returns what mock_session.artist returns
-        assert response.status_code != 401
-
-    def test_decorator_custom_client_invalid_token(self, client, mock_session_file, mocker):
-        """Custom client: route returns 401 when token is invalid."""
-        mock_session = MagicMock(spec=[])  # No login_session_file_auto
-        mock_session._is_token_valid = MagicMock(return_value=False)
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
-
-        response = client.get("/api/artists/1")
-        assert response.status_code == 401
+        assert response.status_code == expected_status
 
     def test_decorator_browser_session_not_authenticated(self, client):
         """BrowserSession: returns 401 when no session file exists."""
@@ -1,7 +1,6 @@
 """Tests for /api/discover Flask endpoints."""
 
-import json
-from unittest.mock import MagicMock
+import pytest
 
 from tests.conftest import (
     MockAlbum,
@@ -11,24 +10,27 @@ from tests.conftest import (
     MockPageCategory,
     MockPageLink,
     MockTrack,
+    raising,
+    returning,
 )
+from tests.tidal_api.conftest import get_json
+from tidal_api.routes import discovery
+
+# Read-only inputs; tests that need genre.items build their own MockGenre
+GENRES = [MockGenre(name="Pop", path="pop"), MockGenre(name="Rock", path="rock", has_videos=True)]
+POP_ALBUMS = [MockAlbum(id=1, name="Pop Album")]
+ROCK_ARTISTS = [MockArtist(id=2, name="Rock Band")]
 
 
 class TestGetForYou:
     """Tests for GET /api/discover/for-you endpoint."""
 
-    def test_success(self, client, mock_session_file, mocker):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-
+    def test_success(self, client, authed_session):
         category = MockPageCategory(title="Recommended", items=[MockAlbum(id=1, name="Album 1")])
         mock_page = MockPage(title="For You", categories=[category])
-        mock_session.for_you.return_value = mock_page
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
+        authed_session.for_you.return_value = mock_page
 
-        response = client.get("/api/discover/for-you")
-        assert response.status_code == 200
-        data = json.loads(response.data)
+        data = get_json(client, "/api/discover/for-you")
 
         assert data["page_title"] == "For You"
         assert data["category_count"] == 1
@@ -37,58 +39,36 @@ class TestGetForYou:
         assert data["categories"][0]["count"] == 1
         assert data["categories"][0]["items"][0]["type"] == "album"
 
-    def test_empty_categories(self, client, mock_session_file, mocker):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-
+    def test_empty_categories(self, client, authed_session):
         mock_page = MockPage(title="For You", categories=[])
-        mock_session.for_you.return_value = mock_page
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
+        authed_session.for_you.return_value = mock_page
 
-        response = client.get("/api/discover/for-you")
-        assert response.status_code == 200
-        data = json.loads(response.data)
+        data = get_json(client, "/api/discover/for-you")
 
         assert data["category_count"] == 0
         assert data["categories"] == []
 
-    def test_null_categories(self, client, mock_session_file, mocker):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-
+    def test_null_categories(self, client, authed_session):
         mock_page = MockPage(title="For You", categories=None)
-        mock_session.for_you.return_value = mock_page
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
+        authed_session.for_you.return_value = mock_page
 
-        response = client.get("/api/discover/for-you")
-        assert response.status_code == 200
-        data = json.loads(response.data)
+        data = get_json(client, "/api/discover/for-you")
 
         assert data["category_count"] == 0
 
-    def test_not_authenticated(self, client):
-        response = client.get("/api/discover/for-you")
-        assert response.status_code == 401
-
 
 class TestGetExplore:
     """Tests for GET /api/discover/explore endpoint."""
 
-    def test_success(self, client, mock_session_file, mocker):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-
+    def test_success(self, client, authed_session):
         category = MockPageCategory(
             title="Trending",
             items=[MockTrack(id=10, name="Hit Song"), MockArtist(id=20, name="Hot Artist")],
         )
         mock_page = MockPage(title="Explore", categories=[category])
-        mock_session.explore.return_value = mock_page
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
+        authed_session.explore.return_value = mock_page
 
-        response = client.get("/api/discover/explore")
-        assert response.status_code == 200
-        data = json.loads(response.data)
+        data = get_json(client, "/api/discover/explore")
 
         assert data["page_title"] == "Explore"
         assert data["category_count"] == 1
@@ -97,96 +77,58 @@ class TestGetExplore:
         assert "track" in types
         assert "artist" in types
 
-    def test_not_authenticated(self, client):
-        response = client.get("/api/discover/explore")
-        assert response.status_code == 401
-
 
 class TestGetMoods:
     """Tests for GET /api/discover/moods endpoint."""
 
-    def test_success(self, client, mock_session_file, mocker):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-
+    def test_success(self, client, authed_session):
         link1 = MockPageLink(title="Chill", api_path="pages/moods_chill")
         link2 = MockPageLink(title="Party", api_path="pages/moods_party")
         category = MockPageCategory(title="Moods", items=[link1, link2])
         mock_page = MockPage(title="Moods", categories=[category])
-        mock_session.moods.return_value = mock_page
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
+        authed_session.moods.return_value = mock_page
 
-        response = client.get("/api/discover/moods")
-        assert response.status_code == 200
-        data = json.loads(response.data)
+        data = get_json(client, "/api/discover/moods")
 
         assert data["count"] == 2
         assert data["moods"][0]["title"] == "Chill"
         assert data["moods"][0]["api_path"] == "pages/moods_chill"
         assert data["moods"][1]["title"] == "Party"
 
-    def test_empty_moods(self, client, mock_session_file, mocker):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-
+    def test_empty_moods(self, client, authed_session):
         mock_page = MockPage(title="Moods", categories=[])
-        mock_session.moods.return_value = mock_page
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
+        authed_session.moods.return_value = mock_page
 
-        response = client.get("/api/discover/moods")
-        assert response.status_code == 200
-        data = json.loads(response.data)
+        data = get_json(client, "/api/discover/moods")
 
         assert data["count"] == 0
         assert data["moods"] == []
 
-    def test_not_authenticated(self, client):
-        response = client.get("/api/discover/moods")
-        assert response.status_code == 401
-
 
 class TestBrowseMood:
     """Tests for GET /api/discover/moods/<api_path> endpoint."""
 
-    def test_success(self, client, mock_session_file, mocker):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-
+    @pytest.mark.usefixtures("authed_session")
+    def test_success(self, client, monkeypatch):
         category = MockPageCategory(title="Chill Playlists", items=[MockAlbum(id=5, name="Chill Album")])
         mock_page = MockPage(title="Chill", categories=[category])
+        # MockPage.get() returns itself, standing in for Page(session, "").get(api_path)
+        monkeypatch.setattr(discovery, "Page", returning(mock_page))
 
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
-        mocker.patch("tidal_api.routes.discovery.Page", return_value=mock_page)
-
-        response = client.get("/api/discover/moods/pages/moods_chill")
-        assert response.status_code == 200
-        data = json.loads(response.data)
+        data = get_json(client, "/api/discover/moods/pages/moods_chill")
 
         assert data["page_title"] == "Chill"
         assert data["category_count"] == 1
         assert data["categories"][0]["title"] == "Chill Playlists"
 
-    def test_not_authenticated(self, client):
-        response = client.get("/api/discover/moods/pages/moods_chill")
-        assert response.status_code == 401
-
 
 class TestGetGenres:
     """Tests for GET /api/discover/genres endpoint."""
 
-    def test_success(self, client, mock_session_file, mocker):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-
-        mock_session.genre.get_genres.return_value = [
-            MockGenre(name="Pop", path="pop"),
-            MockGenre(name="Rock", path="rock", has_videos=True),
-        ]
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
+    def test_success(self, client, authed_session):
+        authed_session.genre.get_genres.return_value = GENRES
 
-        response = client.get("/api/discover/genres")
-        assert response.status_code == 200
-        data = json.loads(response.data)
+        data = get_json(client, "/api/discover/genres")
 
         assert data["count"] == 2
         assert data["genres"][0]["name"] == "Pop"
@@ -195,112 +137,91 @@ class TestGetGenres:
         assert data["genres"][1]["name"] == "Rock"
         assert data["genres"][1]["has_videos"] is True
 
-    def test_empty_genres(self, client, mock_session_file, mocker):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
+    def test_empty_genres(self, client, authed_session):
+        authed_session.genre.get_genres.return_value = []
 
-        mock_session.genre.get_genres.return_value = []
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
-
-        response = client.get("/api/discover/genres")
-        assert response.status_code == 200
-        data = json.loads(response.data)
+        data = get_json(client, "/api/discover/genres")
 
         assert data["count"] == 0
         assert data["genres"] == []
 
-    def test_not_authenticated(self, client):
-        response = client.get("/api/discover/genres")
-        assert response.status_code == 401
-
 
 class TestBrowseGenre:
     """Tests for GET /api/discover/genres/<genre_path>/<content_type> endpoint."""
 
-    def test_success_albums(self, client, mock_session_file, mocker):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-
+    def test_success_albums(self, client, authed_session):
         mock_genre = MockGenre(name="Pop", path="pop")
-        mock_genre.items = MagicMock(return_value=[MockAlbum(id=1, name="Pop Album")])
-        mock_session.genre.get_genres.return_value = [mock_genre]
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
+        mock_genre.items = returning(POP_ALBUMS)
+        authed_session.genre.get_genres.return_value = [mock_genre]
 
-        response = client.get("/api/discover/genres/pop/albums")
-        assert response.status_code == 200
-        data = json.loads(response.data)
+        data = get_json(client, "/api/discover/genres/pop/albums")
 
         assert data["genre"] == "pop"
         assert data["content_type"] == "albums"
         assert data["count"] == 1
         assert data["items"][0]["name"] == "Pop Album"
 
-    def test_success_artists(self, client, mock_session_file, mocker):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-
+    def test_success_artists(self, client, authed_session):
         mock_genre = MockGenre(name="Rock", path="rock")
-        mock_genre.items = MagicMock(return_value=[MockArtist(id=2, name="Rock Band")])
-        mock_session.genre.get_genres.return_value = [mock_genre]
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
+        mock_genre.items = returning(ROCK_ARTISTS)
+        authed_session.genre.get_genres.return_value = [mock_genre]
 
-        response = client.get("/api/discover/genres/rock/artists")
-        assert response.status_code == 200
-        data = json.loads(response.data)
+        data = get_json(client, "/api/discover/genres/rock/artists")
 
         assert data["genre"] == "rock"
         assert data["content_type"] == "artists"
         assert data["count"] == 1
         assert data["items"][0]["name"] == "Rock Band"
 
-    def test_invalid_content_type(self, client, mock_session_file, mocker):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
-
+    @pytest.mark.usefixtures("authed_session")
+    def test_invalid_content_type(self, client):
         response = client.get("/api/discover/genres/pop/podcasts")
         assert response.status_code == 400
-        data = json.loads(response.data)
+        data = response.get_json()
         assert "Invalid content_type" in data["error"]
 
-    def test_genre_not_found(self, client, mock_session_file, mocker):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-        mock_session.genre.get_genres.return_value = [MockGenre(name="Pop", path="pop")]
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
+    def test_genre_not_found(self, client, authed_session):
+        authed_session.genre.get_genres.return_value = GENRES
 
         response = client.get("/api/discover/genres/nonexistent/albums")
         assert response.status_code == 404
-        data = json.loads(response.data)
+        data = response.get_json()
         assert "not found" in data["error"]
 
-    def test_genre_lacks_content_type(self, client, mock_session_file, mocker):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-
-        mock_genre = MockGenre(name="Pop", path="pop", has_videos=False)
-        mock_session.genre.get_genres.return_value = [mock_genre]
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
+    def test_genre_lacks_content_type(self, client, authed_session):
+        authed_session.genre.get_genres.return_value = GENRES
 
         response = client.get("/api/discover/genres/pop/videos")
         assert response.status_code == 400
-        data = json.loads(response.data)
+        data = response.get_json()
         assert "does not have" in data["error"]
 
-    def test_genre_type_error(self, client, mock_session_file, mocker):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-
+    def test_genre_type_error(self, client, authed_session):
         mock_genre = MockGenre(name="Pop", path="pop")
-        mock_genre.items = MagicMock(side_effect=TypeError("unsupported"))
-        mock_session.genre.get_genres.return_value = [mock_genre]
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
+        mock_genre.items = raising(TypeError("unsupported"))
+        authed_session.genre.get_genres.return_value = [mock_genre]
 
         response = client.get("/api/discover/genres/pop/tracks")
         assert response.status_code == 400
-        data = json.loads(response.data)
+        data = response.get_json()
         assert "does not support" in data["error"]
 
-    def test_not_authenticated(self, client):
-        response = client.get("/api/discover/genres/pop/albums")
+
+class TestDiscoveryNotAuthenticated:
+    """Tests for discovery endpoints without a session file."""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "/api/discover/for-you",
+            "/api/discover/explore",
+            "/api/discover/moods",
+            "/api/discover/moods/pages/moods_chill",
+            "/api/discover/genres",
+            "/api/discover/genres/pop/albums",
+        ],
+    )
+    def test_returns_401(self, client, url):
+        """Test that discovery endpoints require authentication."""
+        response = client.get(url)
         assert response.status_code == 401
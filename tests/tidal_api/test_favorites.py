@@ -1,110 +1,57 @@
 """Tests for /api/favorites Flask endpoints."""
 
-import json
-from unittest.mock import MagicMock
+from unittest.mock import Mock
 
-from tests.conftest import MockAlbum, MockArtist, MockFavorites, MockMix, MockPlaylist, MockTrack, MockVideo
-
-
-class TestGetFavorites:
-    """Tests for GET /api/favorites/<type> endpoint."""
-
-    def _mock_session_with_favorites(self, mocker, favorites):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-        mock_session.user.favorites = favorites
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
-        return mock_session
-
-    def test_get_favorite_artists_success(self, client, mock_session_file, mocker):
-        favorites = MockFavorites()
-        favorites._artists = [MockArtist(id=1, name="Artist 1"), MockArtist(id=2, name="Artist 2")]
-        self._mock_session_with_favorites(mocker, favorites)
-
-        response = client.get("/api/favorites/artists")
-        assert response.status_code == 200
-        data = json.loads(response.data)
-
-        assert data["type"] == "artists"
-        assert data["total"] == 2
-        assert len(data["items"]) == 2
-        assert data["items"][0]["id"] == 1
-        assert data["items"][0]["name"] == "Artist 1"
-
-    def test_get_favorite_albums_success(self, client, mock_session_file, mocker):
-        favorites = MockFavorites()
-        favorites._albums = [MockAlbum(id=10, name="Album 1")]
-        self._mock_session_with_favorites(mocker, favorites)
-
-        response = client.get("/api/favorites/albums")
-        assert response.status_code == 200
-        data = json.loads(response.data)
-
-        assert data["type"] == "albums"
-        assert data["total"] == 1
-        assert data["items"][0]["id"] == 10
-        assert data["items"][0]["name"] == "Album 1"
-
-    def test_get_favorite_tracks_success(self, client, mock_session_file, mocker):
-        favorites = MockFavorites()
-        favorites._tracks = [MockTrack(id=100, name="Track 1")]
-        self._mock_session_with_favorites(mocker, favorites)
+import pytest
 
-        response = client.get("/api/favorites/tracks")
-        assert response.status_code == 200
-        data = json.loads(response.data)
-
-        assert data["type"] == "tracks"
-        assert data["total"] == 1
-        assert data["items"][0]["id"] == 100
-        assert data["items"][0]["title"] == "Track 1"
-
-    def test_get_favorite_videos_success(self, client, mock_session_file, mocker):
-        favorites = MockFavorites()
-        favorites._videos = [MockVideo(id=200, name="Video 1")]
-        self._mock_session_with_favorites(mocker, favorites)
-
-        response = client.get("/api/favorites/videos")
-        assert response.status_code == 200
-        data = json.loads(response.data)
-
-        assert data["type"] == "videos"
-        assert data["total"] == 1
-        assert data["items"][0]["id"] == 200
-        assert data["items"][0]["title"] == "Video 1"
+from tests.conftest import MockAlbum, MockArtist, MockFavorites, MockMix, MockPlaylist, MockTrack, MockVideo
+from tests.tidal_api.conftest import get_json
 
-    def test_get_favorite_playlists_success(self, client, mock_session_file, mocker):
-        favorites = MockFavorites()
-        favorites._playlists = [MockPlaylist(id="pl-1", name="Playlist 1")]
-        self._mock_session_with_favorites(mocker, favorites)
+# (type, id) pairs accepted by both POST and DELETE; ids are echoed back as strings
+FAV_CASES = [("artists", "123"), ("albums", 456), ("tracks", "789"), ("videos", "999"), ("playlists", "pl-1")]
 
-        response = client.get("/api/favorites/playlists")
-        assert response.status_code == 200
-        data = json.loads(response.data)
 
-        assert data["type"] == "playlists"
-        assert data["total"] == 1
-        assert data["items"][0]["id"] == "pl-1"
-        assert data["items"][0]["title"] == "Playlist 1"
+@pytest.fixture(scope="class")
+def populated_favorites():
+    """Favorites with every type populated, shared by the read-only GET tests."""
+    favorites = MockFavorites()
+    favorites._artists = [MockArtist(id=1, name="Artist 1"), MockArtist(id=2, name="Artist 2")]
+    favorites._albums = [MockAlbum(id=10, name="Album 1")]
+    favorites._tracks = [MockTrack(id=100, name="Track 1")]
+    favorites._videos = [MockVideo(id=200, name="Video 1")]
+    favorites._playlists = [MockPlaylist(id="pl-1", name="Playlist 1")]
+    favorites._mixes = [MockMix(id="mix-1", title="My Mix")]
+    return favorites
 
-    def test_get_favorite_mixes_success(self, client, mock_session_file, mocker):
-        favorites = MockFavorites()
-        favorites._mixes = [MockMix(id="mix-1", title="My Mix")]
-        self._mock_session_with_favorites(mocker, favorites)
 
-        response = client.get("/api/favorites/mixes")
-        assert response.status_code == 200
-        data = json.loads(response.data)
-
-        assert data["type"] == "mixes"
-        assert data["total"] == 1
-        assert data["items"][0]["id"] == "mix-1"
-        assert data["items"][0]["title"] == "My Mix"
+class TestGetFavorites:
+    """Tests for GET /api/favorites/<type> endpoint."""
 
-    def test_get_favorite_tracks_with_order_params(self, client, mock_session_file, mocker):
-        favorites = MagicMock()
+    @pytest.mark.parametrize(
+        ("fav_type", "total", "first_item"),
+        [
+            ("artists", 2, {"id": 1, "name": "Artist 1"}),
+            ("albums", 1, {"id": 10, "name": "Album 1"}),
+            ("tracks", 1, {"id": 100, "title": "Track 1"}),
+            ("videos", 1, {"id": 200, "title": "Video 1"}),
+            ("playlists", 1, {"id": "pl-1", "title": "Playlist 1"}),
+            ("mixes", 1, {"id": "mix-1", "title": "My Mix"}),
+        ],
+    )
+    def test_get_favorites_success(self, client, authed_session, populated_favorites, fav_type, total, first_item):
+        authed_session.user.favorites = populated_favorites
+
+        data = get_json(client, f"/api/favorites/{fav_type}")
+
+        assert data["type"] == fav_type
+        assert data["total"] == total
+        assert len(data["items"]) == total
+        assert {key: data["items"][0][key] for key in first_item} == first_item
+
+    def test_get_favorite_tracks_with_order_params(self, client, authed_session):
+        favorites = Mock(spec=MockFavorites)
         favorites.tracks.return_value = [MockTrack(id=100, name="Track 1")]
-        self._mock_session_with_favorites(mocker, favorites)
+        authed_session.user.favorites = favorites
 
         response = client.get("/api/favorites/tracks?order=NAME&order_direction=ASC&limit=10")
         assert response.status_code == 200
@@ -114,174 +61,87 @@ class TestGetFavorites:
         assert call_kwargs["order"] == "NAME"
         assert call_kwargs["order_direction"] == "ASC"
 
-    def test_get_favorites_invalid_type(self, client, mock_session_file, mocker):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
-
+    @pytest.mark.usefixtures("authed_session")
+    def test_get_favorites_invalid_type(self, client):
         response = client.get("/api/favorites/invalid")
         assert response.status_code == 400
-        data = json.loads(response.data)
+        data = response.get_json()
         assert "Invalid type" in data["error"]
 
-    def test_get_favorites_not_authenticated(self, client):
-        response = client.get("/api/favorites/artists")
-        assert response.status_code == 401
-
 
 class TestAddFavorite:
     """Tests for POST /api/favorites/<type> endpoint."""
 
-    def _mock_session_with_favorites(self, mocker, favorites):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-        mock_session.user.favorites = favorites
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
-        return mock_session
+    @pytest.mark.parametrize(("fav_type", "fav_id"), FAV_CASES)
+    def test_add_favorite_success(self, client, authed_session, fav_type, fav_id):
+        authed_session.user.favorites = MockFavorites()
 
-    def test_add_favorite_artist_success(self, client, mock_session_file, mocker):
-        favorites = MockFavorites()
-        self._mock_session_with_favorites(mocker, favorites)
-
-        response = client.post("/api/favorites/artists", json={"id": "123"}, content_type="application/json")
+        response = client.post(f"/api/favorites/{fav_type}", json={"id": fav_id})
         assert response.status_code == 200
-        data = json.loads(response.data)
-
-        assert data["status"] == "success"
-        assert data["type"] == "artists"
-        assert data["id"] == "123"
-
-    def test_add_favorite_album_success(self, client, mock_session_file, mocker):
-        favorites = MockFavorites()
-        self._mock_session_with_favorites(mocker, favorites)
+        data = response.get_json()
 
-        response = client.post("/api/favorites/albums", json={"id": 456}, content_type="application/json")
-        assert response.status_code == 200
-        data = json.loads(response.data)
         assert data["status"] == "success"
-        assert data["type"] == "albums"
-        assert data["id"] == "456"
-
-    def test_add_favorite_track_success(self, client, mock_session_file, mocker):
-        favorites = MockFavorites()
-        self._mock_session_with_favorites(mocker, favorites)
+        assert data["type"] == fav_type
+        assert data["id"] == str(fav_id)
 
-        response = client.post("/api/favorites/tracks", json={"id": "789"}, content_type="application/json")
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        assert data["status"] == "success"
-        assert data["type"] == "tracks"
-
-    def test_add_favorite_video_success(self, client, mock_session_file, mocker):
-        favorites = MockFavorites()
-        self._mock_session_with_favorites(mocker, favorites)
-
-        response = client.post("/api/favorites/videos", json={"id": "999"}, content_type="application/json")
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        assert data["status"] == "success"
-        assert data["type"] == "videos"
-
-    def test_add_favorite_playlist_success(self, client, mock_session_file, mocker):
-        favorites = MockFavorites()
-        self._mock_session_with_favorites(mocker, favorites)
-
-        response = client.post("/api/favorites/playlists", json={"id": "pl-1"}, content_type="application/json")
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        assert data["status"] == "success"
-        assert data["type"] == "playlists"
-
-    def test_add_favorite_mixes_returns_400(self, client, mock_session_file, mocker):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
-
-        response = client.post("/api/favorites/mixes", json={"id": "mix-1"}, content_type="application/json")
+    @pytest.mark.usefixtures("authed_session")
+    def test_add_favorite_mixes_returns_400(self, client):
+        response = client.post("/api/favorites/mixes", json={"id": "mix-1"})
         assert response.status_code == 400
-        data = json.loads(response.data)
+        data = response.get_json()
         assert "Cannot add" in data["error"]
 
-    def test_add_favorite_invalid_type(self, client, mock_session_file, mocker):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
-
-        response = client.post("/api/favorites/invalid", json={"id": "123"}, content_type="application/json")
+    @pytest.mark.usefixtures("authed_session")
+    def test_add_favorite_invalid_type(self, client):
+        response = client.post("/api/favorites/invalid", json={"id": "123"})
         assert response.status_code == 400
-        data = json.loads(response.data)
+        data = response.get_json()
         assert "Invalid type" in data["error"]
 
-    def test_add_favorite_missing_id(self, client, mock_session_file, mocker):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
-
-        response = client.post("/api/favorites/artists", json={}, content_type="application/json")
+    @pytest.mark.usefixtures("authed_session")
+    def test_add_favorite_missing_id(self, client):
+        response = client.post("/api/favorites/artists", json={})
         assert response.status_code == 400
 
-    def test_add_favorite_not_authenticated(self, client):
-        response = client.post("/api/favorites/artists", json={"id": "123"}, content_type="application/json")
-        assert response.status_code == 401
-
 
 class TestRemoveFavorite:
     """Tests for DELETE /api/favorites/<type> endpoint."""
 
-    def _mock_session_with_favorites(self, mocker, favorites):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-        mock_session.user.favorites = favorites
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
-        return mock_session
+    @pytest.mark.parametrize(("fav_type", "fav_id"), FAV_CASES)
+    def test_remove_favorite_success(self, client, authed_session, fav_type, fav_id):
+        authed_session.user.favorites = MockFavorites()
 
-    def test_remove_favorite_artist_success(self, client, mock_session_file, mocker):
-        favorites = MockFavorites()
-        self._mock_session_with_favorites(mocker, favorites)
-
-        response = client.delete("/api/favorites/artists", json={"id": "123"}, content_type="application/json")
+        response = client.delete(f"/api/favorites/{fav_type}", json={"id": fav_id})
         assert response.status_code == 200
-        data = json.loads(response.data)
-        assert data["status"] == "success"
-        assert data["type"] == "artists"
-        assert data["id"] == "123"
+        data = response.get_json()
 
-    def test_remove_favorite_track_success(self, client, mock_session_file, mocker):
-        favorites = MockFavorites()
-        self._mock_session_with_favorites(mocker, favorites)
-
-        response = client.delete("/api/favorites/tracks", json={"id": "789"}, content_type="application/json")
-        assert response.status_code == 200
-        data = json.loads(response.data)
         assert data["status"] == "success"
-        assert data["type"] == "tracks"
+        assert data["type"] == fav_type
+        assert data["id"] == str(fav_id)
 
-    def test_remove_favorite_mixes_returns_400(self, client, mock_session_file, mocker):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
-
-        response = client.delete("/api/favorites/mixes", json={"id": "mix-1"}, content_type="application/json")
+    @pytest.mark.usefixtures("authed_session")
+    def test_remove_favorite_mixes_returns_400(self, client):
+        response = client.delete("/api/favorites/mixes", json={"id": "mix-1"})
         assert response.status_code == 400
-        data = json.loads(response.data)
+        data = response.get_json()
         assert "Cannot remove" in data["error"]
 
-    def test_remove_favorite_invalid_type(self, client, mock_session_file, mocker):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
+    @pytest.mark.usefixtures("authed_session")
+    def test_remove_favorite_invalid_type(self, client):
+        response = client.delete("/api/favorites/invalid", json={"id": "123"})
+        assert response.status_code == 400
 
-        response = client.delete("/api/favorites/invalid", json={"id": "123"}, content_type="application/json")
+    @pytest.mark.usefixtures("authed_session")
+    def test_remove_favorite_missing_id(self, client):
+        response = client.delete("/api/favorites/artists", json={})
         assert response.status_code == 400
 
-    def test_remove_favorite_missing_id(self, client, mock_session_file, mocker):
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
 
-        response = client.delete("/api/favorites/artists", json={}, content_type="application/json")
-        assert response.status_code == 400
+class TestFavoritesNotAuthenticated:
+    """Tests for favorites endpoints without a session file."""
 
-    def test_remove_favorite_not_authenticated(self, client):
-        response = client.delete("/api/favorites/artists", json={"id": "123"}, content_type="application/json")
+    @pytest.mark.parametrize("method", ["GET", "POST", "DELETE"])
+    def test_returns_401(self, client, method):
+        """Test that favorites endpoints require authentication."""
+        response = client.open("/api/favorites/artists", method=method, json={"id": "123"})
         assert response.status_code == 401
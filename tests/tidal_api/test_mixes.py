@@ -1,36 +1,71 @@
 """Tests for /api/mixes Flask endpoints."""
 
-import json
-from unittest.mock import MagicMock
-
-from tests.conftest import MockMix, MockTrack
+import pytest
+
+from tests.conftest import MockMix, MockPage, MockPageCategory, MockTrack, returning
+from tests.tidal_api.conftest import get_json
+
+# One more track than the limit in test_get_mix_tracks_with_limit
+MIX_TRACKS = [MockTrack(id=i, name=f"Track {i}") for i in range(1, 4)]
+
+# Raw API payloads returned by the custom client's mixes endpoint
+CUSTOM_USER_MIXES = [
+    {
+        "id": "mix-1",
+        "title": "Daily Mix 1",
+        "subTitle": "Based on your plays",
+        "shortSubtitle": "Daily",
+        "mixType": "DAILY_MIX",
+        "images": None,
+    },
+    {
+        "id": "mix-2",
+        "title": "Discovery Mix",
+        "subTitle": "New music",
+        "shortSubtitle": "Discovery",
+        "mixType": "DISCOVERY_MIX",
+        "images": None,
+    },
+]
+CUSTOM_MIX_TRACKS = [
+    {
+        "id": 1,
+        "title": "Track One",
+        "duration": 200,
+        "artist": {"id": "a1", "name": "Artist A"},
+        "album": {"id": "al1", "title": "Album A"},
+    },
+    {
+        "id": 2,
+        "title": "Track Two",
+        "duration": 180,
+        "artist": {"id": "a2", "name": "Artist B"},
+        "album": {"id": "al2", "title": "Album B"},
+    },
+]
+
+
+@pytest.fixture
+def mix_with_tracks(authed_session):
+    """Authenticated session whose mix() returns a mix of MIX_TRACKS."""
+    mock_mix = MockMix(id="mix-1", title="Daily Mix 1")
+    mock_mix.items = returning(MIX_TRACKS)
+    authed_session.mix.return_value = mock_mix
+    return mock_mix
 
 
 class TestGetUserMixes:
     """Tests for GET /api/mixes endpoint."""
 
-    def test_get_user_mixes_success(self, client, mock_session_file, mocker):
+    def test_get_user_mixes_success(self, client, authed_session):
         """Test successfully fetching user mixes."""
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-
-        # Mock Page object with categories
-        mock_page = MagicMock()
-        mock_category1 = MagicMock()
-        mock_category1.items = [
-            MockMix(id="mix-1", title="Daily Mix 1"),
-            MockMix(id="mix-2", title="Daily Mix 2"),
-        ]
-        mock_category2 = MagicMock()
-        mock_category2.items = [MockMix(id="mix-3", title="Discovery Mix")]
-        mock_page.categories = [mock_category1, mock_category2]
-
-        mock_session.mixes.return_value = mock_page
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
-
-        response = client.get("/api/mixes")
-        assert response.status_code == 200
-        data = json.loads(response.data)
+        category1 = MockPageCategory(
+            items=[MockMix(id="mix-1", title="Daily Mix 1"), MockMix(id="mix-2", title="Daily Mix 2")]
+        )
+        category2 = MockPageCategory(items=[MockMix(id="mix-3", title="Discovery Mix")])
+        authed_session.mixes.return_value = MockPage(title="My Mixes", categories=[category1, category2])
+
+        data = get_json(client, "/api/mixes")
 
         assert data["count"] == 3
         assert len(data["mixes"]) == 3
@@ -39,206 +74,81 @@ class TestGetUserMixes:
         assert data["mixes"][1]["id"] == "mix-2"
         assert data["mixes"][2]["id"] == "mix-3"
 
-    def test_get_user_mixes_empty(self, client, mock_session_file, mocker):
+    def test_get_user_mixes_empty(self, client, authed_session):
         """Test fetching mixes when none exist."""
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
+        authed_session.mixes.return_value = MockPage(title="My Mixes", categories=[])
 
-        mock_page = MagicMock()
-        mock_page.categories = []
-        mock_session.mixes.return_value = mock_page
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
-
-        response = client.get("/api/mixes")
-        assert response.status_code == 200
-        data = json.loads(response.data)
+        data = get_json(client, "/api/mixes")
 
         assert data["count"] == 0
         assert data["mixes"] == []
 
-    def test_get_user_mixes_not_authenticated(self, client):
-        """Test fetching mixes when not authenticated."""
-        response = client.get("/api/mixes")
-        assert response.status_code == 401
-
 
 class TestGetMixTracks:
     """Tests for GET /api/mixes/<id>/tracks endpoint."""
 
-    def test_get_mix_tracks_success(self, client, mock_session_file, mocker):
+    @pytest.mark.usefixtures("mix_with_tracks")
+    def test_get_mix_tracks_success(self, client):
         """Test successfully fetching mix tracks."""
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-
-        mock_mix = MockMix(id="mix-1", title="Daily Mix 1")
-        mock_mix.items = MagicMock(
-            return_value=[
-                MockTrack(id=1, name="Track 1"),
-                MockTrack(id=2, name="Track 2"),
-                MockTrack(id=3, name="Track 3"),
-            ]
-        )
-        mock_session.mix.return_value = mock_mix
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
-
-        response = client.get("/api/mixes/mix-1/tracks")
-        assert response.status_code == 200
-        data = json.loads(response.data)
+        data = get_json(client, "/api/mixes/mix-1/tracks")
 
         assert data["count"] == 3
         assert len(data["tracks"]) == 3
         assert data["tracks"][0]["id"] == 1
         assert data["tracks"][0]["title"] == "Track 1"
 
-    def test_get_mix_tracks_with_limit(self, client, mock_session_file, mocker):
+    @pytest.mark.usefixtures("mix_with_tracks")
+    def test_get_mix_tracks_with_limit(self, client):
         """Test fetching mix tracks with limit parameter."""
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-
-        mock_mix = MockMix(id="mix-1", title="Daily Mix 1")
-        mock_mix.items = MagicMock(
-            return_value=[
-                MockTrack(id=1, name="Track 1"),
-                MockTrack(id=2, name="Track 2"),
-                MockTrack(id=3, name="Track 3"),
-            ]
-        )
-        mock_session.mix.return_value = mock_mix
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
-
-        response = client.get("/api/mixes/mix-1/tracks?limit=2")
-        assert response.status_code == 200
-        data = json.loads(response.data)
+        data = get_json(client, "/api/mixes/mix-1/tracks?limit=2")
 
         assert data["count"] == 2
         assert len(data["tracks"]) == 2
 
-    def test_get_mix_tracks_not_found(self, client, mock_session_file, mocker):
+    def test_get_mix_tracks_not_found(self, client, authed_session):
         """Test fetching tracks from non-existent mix."""
-        mock_session = MagicMock()
-        mock_session.login_session_file_auto.return_value = True
-        mock_session.mix.return_value = None
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_session)
+        authed_session.mix.return_value = None
 
         response = client.get("/api/mixes/nonexistent/tracks")
         assert response.status_code == 404
 
-    def test_get_mix_tracks_not_authenticated(self, client):
-        """Test fetching mix tracks when not authenticated."""
-        response = client.get("/api/mixes/mix-1/tracks")
-        assert response.status_code == 401
-
 
 class TestGetUserMixesCustomClient:
     """Tests for GET /api/mixes with TIDAL_USE_CUSTOM_CLIENT=true."""
 
-    def test_get_user_mixes_success_custom_client(self, client, mock_session_file, mocker, monkeypatch):
-        """Test successfully fetching user mixes via custom client."""
-        monkeypatch.setenv("TIDAL_USE_CUSTOM_CLIENT", "true")
-        monkeypatch.setenv("TIDAL_CLIENT_ID", "test_id")
-        monkeypatch.setenv("TIDAL_CLIENT_SECRET", "test_secret")
-        mock_custom_session = MagicMock()
-        mock_custom_session._is_token_valid.return_value = True
-        mock_custom_session.mixes.get_user_mixes.return_value = [
-            {
-                "id": "mix-1",
-                "title": "Daily Mix 1",
-                "subTitle": "Based on your plays",
-                "shortSubtitle": "Daily",
-                "mixType": "DAILY_MIX",
-                "images": None,
-            },
-            {
-                "id": "mix-2",
-                "title": "Discovery Mix",
-                "subTitle": "New music",
-                "shortSubtitle": "Discovery",
-                "mixType": "DISCOVERY_MIX",
-                "images": None,
-            },
-        ]
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_custom_session)
-        response = client.get("/api/mixes")
-        assert response.status_code == 200
-        data = response.get_json()
-        assert data["count"] == 2
-        assert len(data["mixes"]) == 2
-        assert data["mixes"][0]["id"] == "mix-1"
-        assert data["mixes"][1]["id"] == "mix-2"
-
-    def test_get_user_mixes_empty_custom_client(self, client, mock_session_file, mocker, monkeypatch):
-        """Test fetching user mixes returns empty list via custom client."""
-        monkeypatch.setenv("TIDAL_USE_CUSTOM_CLIENT", "true")
-        monkeypatch.setenv("TIDAL_CLIENT_ID", "test_id")
-        monkeypatch.setenv("TIDAL_CLIENT_SECRET", "test_secret")
-        mock_custom_session = MagicMock()
-        mock_custom_session._is_token_valid.return_value = True
-        mock_custom_session.mixes.get_user_mixes.return_value = []
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_custom_session)
-        response = client.get("/api/mixes")
-        assert response.status_code == 200
-        data = response.get_json()
-        assert data["count"] == 0
-        assert data["mixes"] == []
-
-    def test_get_user_mixes_not_authenticated_custom_client(self, client, monkeypatch):
-        """Test fetching user mixes when not authenticated via custom client."""
-        monkeypatch.setenv("TIDAL_USE_CUSTOM_CLIENT", "true")
-        response = client.get("/api/mixes")
-        assert response.status_code == 401
+    @pytest.mark.parametrize("payload", [pytest.param(CUSTOM_USER_MIXES, id="mixes"), pytest.param([], id="empty")])
+    def test_get_user_mixes_custom_client(self, client, custom_client_session, payload):
+        """Test fetching user mixes via custom client."""
+        custom_client_session.mixes.get_user_mixes.return_value = payload
+        data = get_json(client, "/api/mixes")
+        assert data["count"] == len(payload)
+        assert [mix["id"] for mix in data["mixes"]] == [mix["id"] for mix in payload]
 
 
 class TestGetMixTracksCustomClient:
     """Tests for GET /api/mixes/<id>/tracks with TIDAL_USE_CUSTOM_CLIENT=true."""
 
-    def test_get_mix_tracks_success_custom_client(self, client, mock_session_file, mocker, monkeypatch):
-        """Test successfully fetching mix tracks via custom client."""
-        monkeypatch.setenv("TIDAL_USE_CUSTOM_CLIENT", "true")
-        monkeypatch.setenv("TIDAL_CLIENT_ID", "test_id")
-        monkeypatch.setenv("TIDAL_CLIENT_SECRET", "test_secret")
-        mock_custom_session = MagicMock()
-        mock_custom_session._is_token_valid.return_value = True
-        mock_custom_session.mixes.get_mix_tracks.return_value = [
-            {
-                "id": 1,
-                "title": "Track One",
-                "duration": 200,
-                "artist": {"id": "a1", "name": "Artist A"},
-                "album": {"id": "al1", "title": "Album A"},
-            },
-            {
-                "id": 2,
-                "title": "Track Two",
-                "duration": 180,
-                "artist": {"id": "a2", "name": "Artist B"},
-                "album": {"id": "al2", "title": "Album B"},
-            },
-        ]
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_custom_session)
-        response = client.get("/api/mixes/mix-1/tracks")
-        assert response.status_code == 200
-        data = response.get_json()
-        assert data["count"] == 2
-        assert len(data["tracks"]) == 2
-        mock_custom_session.mixes.get_mix_tracks.assert_called_once_with("mix-1")
-
-    def test_get_mix_tracks_empty_custom_client(self, client, mock_session_file, mocker, monkeypatch):
-        """Test fetching mix tracks returns empty list when mix not found via custom client."""
-        monkeypatch.setenv("TIDAL_USE_CUSTOM_CLIENT", "true")
-        monkeypatch.setenv("TIDAL_CLIENT_ID", "test_id")
-        monkeypatch.setenv("TIDAL_CLIENT_SECRET", "test_secret")
-        mock_custom_session = MagicMock()
-        mock_custom_session._is_token_valid.return_value = True
-        mock_custom_session.mixes.get_mix_tracks.return_value = []
-        mocker.patch("tidal_api.utils._create_tidal_session", return_value=mock_custom_session)
-        response = client.get("/api/mixes/missing-mix/tracks")
-        assert response.status_code == 200
-        data = response.get_json()
-        assert data["count"] == 0
-        assert data["tracks"] == []
-
-    def test_get_mix_tracks_not_authenticated_custom_client(self, client, monkeypatch):
-        """Test fetching mix tracks when not authenticated via custom client."""
-        monkeypatch.setenv("TIDAL_USE_CUSTOM_CLIENT", "true")
-        response = client.get("/api/mixes/mix-1/tracks")
+    @pytest.mark.parametrize(
+        ("mix_id", "payload"),
+        [pytest.param("mix-1", CUSTOM_MIX_TRACKS, id="tracks"), pytest.param("missing-mix", [], id="empty")],
+    )
+    def test_get_mix_tracks_custom_client(self, client, custom_client_session, mix_id, payload):
+        """Test fetching mix tracks via custom client; an unknown mix yields an empty list."""
+        custom_client_session.mixes.get_mix_tracks.return_value = payload
+        data = get_json(client, f"/api/mixes/{mix_id}/tracks")
+        assert data["count"] == len(payload)
+        assert len(data["tracks"]) == len(payload)
+        custom_client_session.mixes.get_mix_tracks.assert_called_once_with(mix_id)
+
+
+class TestMixesNotAuthenticated:
+    """Tests for mix endpoints without a session file, in both client modes."""
+
+    @pytest.mark.parametrize("use_custom_client", [False, True], ids=["browser", "custom"])
+    @pytest.mark.parametrize("url", ["/api/mixes", "/api/mixes/mix-1/tracks"])
+    def test_returns_401(self, client, monkeypatch, url, use_custom_client):
+        """Test that mix endpoints require authentication."""
+        if use_custom_client:
+            monkeypatch.setenv("TIDAL_USE_CUSTOM_CLIENT", "true")
+        response = client.get(url)
         assert response.status_code == 401
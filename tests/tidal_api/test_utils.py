@@ -1,76 +1,82 @@
 """Tests for tidal_api/utils.py formatters and helpers."""
 
 import sys
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+
+import pytest
 
 from tests.conftest import (
     MockAlbum,
     MockArtist,
     MockCreator,
     MockPlaylist,
-    MockTrack,
     MockUserPlaylist,
     MockVideo,
 )
+from tidal_api import utils as tidal_utils
+from tidal_api.utils import (
+    bound_limit,
+    check_user_playlist,
+    fetch_all_paginated,
+    format_album_data,
+    format_artist_data,
+    format_playlist_search_data,
+    format_track_data,
+    format_user_playlist_data,
+    format_video_data,
+    get_playlist_or_404,
+    handle_endpoint_errors,
+    require_json_body,
+    safe_attr,
+    tidal_album_url,
+    tidal_artist_url,
+    tidal_playlist_url,
+    tidal_track_url,
+    tidal_video_url,
+)
 
-# Add project paths for imports
-tidal_api_path = str(Path(__file__).parent.parent.parent / "tidal_api")
-if tidal_api_path not in sys.path:
-    sys.path.insert(0, tidal_api_path)
 
-# Import directly from the file to avoid module caching issues
-import importlib.util
+def test_utils_is_the_package_module():
+    """Patches on tidal_api.utils must reach the module under test, not a second loaded copy."""
+    assert tidal_utils is sys.modules["tidal_api.utils"]
 
-spec = importlib.util.spec_from_file_location(
-    "tidal_utils", Path(__file__).parent.parent.parent / "tidal_api" / "utils.py"
-)
-tidal_utils = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(tidal_utils)
-
-format_track_data = tidal_utils.format_track_data
-format_artist_data = tidal_utils.format_artist_data
-format_album_data = tidal_utils.format_album_data
-format_playlist_search_data = tidal_utils.format_playlist_search_data
-format_video_data = tidal_utils.format_video_data
-format_user_playlist_data = tidal_utils.format_user_playlist_data
-bound_limit = tidal_utils.bound_limit
-fetch_all_paginated = tidal_utils.fetch_all_paginated
-safe_attr = tidal_utils.safe_attr
-handle_endpoint_errors = tidal_utils.handle_endpoint_errors
-tidal_track_url = tidal_utils.tidal_track_url
-tidal_artist_url = tidal_utils.tidal_artist_url
-tidal_album_url = tidal_utils.tidal_album_url
-tidal_playlist_url = tidal_utils.tidal_playlist_url
-tidal_video_url = tidal_utils.tidal_video_url
-get_playlist_or_404 = tidal_utils.get_playlist_or_404
-require_json_body = tidal_utils.require_json_body
-check_user_playlist = tidal_utils.check_user_playlist
+
+# format_track_data output for the default MockTrack
+EXPECTED_TRACK = {
+    "id": 789,
+    "title": "Test Track",
+    "artist": "Test Artist",
+    "album": "Test Album",
+    "duration": 240,
+    "url": "https://tidal.com/browse/track/789?u",
+}
+
+
+def _identity(payload):
+    return payload
+
+
+@pytest.fixture(autouse=True)
+def _identity_jsonify(monkeypatch):
+    """Make jsonify return its payload so error responses can be inspected directly."""
+    monkeypatch.setattr(tidal_utils, "jsonify", _identity)
 
 
 class TestFormatTrackData:
     """Tests for format_track_data function."""
 
-    def test_basic_track_formatting(self):
-        track = MockTrack()
-        result = format_track_data(track)
+    def test_basic_track_formatting(self, mock_track):
+        result = format_track_data(mock_track)
 
-        assert result["id"] == 789
-        assert result["title"] == "Test Track"
-        assert result["artist"] == "Test Artist"
-        assert result["album"] == "Test Album"
-        assert result["duration"] == 240
-        assert "tidal.com/browse/track/789" in result["url"]
+        assert result == EXPECTED_TRACK
 
-    def test_track_with_source_id(self):
-        track = MockTrack()
-        result = format_track_data(track, source_track_id="source-123")
+    def test_track_with_source_id(self, mock_track):
+        result = format_track_data(mock_track, source_track_id="source-123")
 
-        assert result["source_track_id"] == "source-123"
+        assert result == {**EXPECTED_TRACK, "source_track_id": "source-123"}
 
-    def test_track_without_source_id(self):
-        track = MockTrack()
-        result = format_track_data(track)
+    def test_track_without_source_id(self, mock_track):
+        result = format_track_data(mock_track)
 
         assert "source_track_id" not in result
 
@@ -103,13 +109,16 @@ class TestFormatAlbumData:
         album = MockAlbum(id=300, name="Great Album", artist=artist)
         result = format_album_data(album)
 
-        assert result["id"] == 300
-        assert result["name"] == "Great Album"
-        assert result["artist"] == "Album Artist"
-        assert result["release_date"] == "2024-01-15"
-        assert result["num_tracks"] == 12
-        assert result["duration"] == 3600
-        assert "tidal.com/browse/album/300" in result["url"]
+        assert result == {
+            "id": 300,
+            "name": "Great Album",
+            "artist": "Album Artist",
+            "cover_url": "https://tidal.com/image/300/640",
+            "release_date": "2024-01-15",
+            "num_tracks": 12,
+            "duration": 3600,
+            "url": "https://tidal.com/browse/album/300",
+        }
 
     def test_album_cover_url(self):
         album = MockAlbum(id=400)
@@ -127,12 +136,14 @@ class TestFormatPlaylistSearchData:
         playlist = MockPlaylist(id="playlist-123", name="My Playlist", creator=creator)
         result = format_playlist_search_data(playlist)
 
-        assert result["id"] == "playlist-123"
-        assert result["title"] == "My Playlist"
-        assert result["creator"] == "Playlist Creator"
-        assert result["track_count"] == 25
-        assert result["duration"] == 5400
-        assert "tidal.com/playlist/playlist-123" in result["url"]
+        assert result == {
+            "id": "playlist-123",
+            "title": "My Playlist",
+            "creator": "Playlist Creator",
+            "track_count": 25,
+            "duration": 5400,
+            "url": "https://tidal.com/playlist/playlist-123",
+        }
 
     def test_playlist_without_creator(self):
         playlist = MockPlaylist(id="playlist-456")
@@ -150,76 +161,84 @@ class TestFormatVideoData:
         video = MockVideo(id=500, name="Music Video", artist=artist)
         result = format_video_data(video)
 
-        assert result["id"] == 500
-        assert result["title"] == "Music Video"
-        assert result["artist"] == "Video Artist"
-        assert result["duration"] == 300
-        assert "tidal.com/browse/video/500" in result["url"]
+        assert result == {
+            "id": 500,
+            "title": "Music Video",
+            "artist": "Video Artist",
+            "duration": 300,
+            "url": "https://tidal.com/browse/video/500",
+        }
 
 
 class TestBoundLimit:
     """Tests for bound_limit function."""
 
-    def test_normal_limit(self):
-        assert bound_limit(25) == 25
-        assert bound_limit(10) == 10
+    @pytest.mark.parametrize(
+        "n, kwargs, expected",
+        [
+            pytest.param(25, {}, 25, id="normal"),
+            pytest.param(10, {}, 10, id="normal-small"),
+            pytest.param(0, {}, 1, id="zero"),
+            pytest.param(-5, {}, 1, id="negative"),
+            pytest.param(-100, {}, 1, id="very-negative"),
+            pytest.param(5001, {}, 5000, id="above-default-max"),
+            pytest.param(10000, {}, 5000, id="far-above-default-max"),
+            pytest.param(100, {"max_n": 200}, 100, id="custom-max-within"),
+            pytest.param(300, {"max_n": 200}, 200, id="custom-max-above"),
+            pytest.param(100, {"max_n": 50}, 50, id="custom-max-lower"),
+            pytest.param(1, {}, 1, id="boundary-min"),
+            pytest.param(5000, {}, 5000, id="boundary-default-max"),
+            pytest.param(50, {"max_n": 50}, 50, id="boundary-custom-max"),
+        ],
+    )
+    def test_bound_limit(self, n, kwargs, expected):
+        assert bound_limit(n, **kwargs) == expected
+
+
+@pytest.fixture(scope="session")
+def paged_items():
+    """Sequential source items shared by the fetch_all_paginated tests."""
+    return list(range(1000))
+
+
+@pytest.fixture(scope="session")
+def slicing_fetch(paged_items):
+    """Factory for fetch_fn callables that page through the first src_len paged_items."""
+
+    def make_fetch_fn(src_len=len(paged_items)):
+        def fetch_fn(limit, offset):
+            return paged_items[offset : min(offset + limit, src_len)]
 
-    def test_limit_below_minimum(self):
-        assert bound_limit(0) == 1
-        assert bound_limit(-5) == 1
-        assert bound_limit(-100) == 1
+        return fetch_fn
 
-    def test_limit_above_maximum_default(self):
-        """Test limit above default max (5000) is clamped."""
-        assert bound_limit(5001) == 5000
-        assert bound_limit(10000) == 5000
+    return make_fetch_fn
 
-    def test_custom_max_limit(self):
-        assert bound_limit(100, max_n=200) == 100
-        assert bound_limit(300, max_n=200) == 200
-        assert bound_limit(100, max_n=50) == 50
 
-    def test_boundary_values(self):
-        assert bound_limit(1) == 1
-        assert bound_limit(5000) == 5000
-        assert bound_limit(50, max_n=50) == 50
+def _assert_sequential(result, n):
+    """Assert result is exactly 0..n-1 in order, reporting the first index that differs."""
+    assert len(result) == n
+    for i, value in enumerate(result):
+        assert value == i, i
 
 
 class TestFetchAllPaginated:
     """Tests for the fetch_all_paginated function."""
 
-    def test_single_batch_exact_count(self):
-        """Test fetching when all items fit in a single batch."""
-        items = list(range(30))
-
-        def fetch_fn(limit, offset):
-            return items[offset : offset + limit]
-
-        result = fetch_all_paginated(fetch_fn, limit=30, page_size=50)
-        assert result == list(range(30))
-        assert len(result) == 30
-
-    def test_multiple_batches(self):
-        """Test fetching across multiple batches."""
-        items = list(range(120))
-
-        def fetch_fn(limit, offset):
-            return items[offset : offset + limit]
-
-        result = fetch_all_paginated(fetch_fn, limit=120, page_size=50)
-        assert result == list(range(120))
-        assert len(result) == 120
-
-    def test_limit_less_than_page_size(self):
-        """Test fetching when limit is less than page_size."""
-        items = list(range(100))
-
-        def fetch_fn(limit, offset):
-            return items[offset : offset + limit]
-
-        result = fetch_all_paginated(fetch_fn, limit=25, page_size=50)
-        assert result == list(range(25))
-        assert len(result) == 25
+    @pytest.mark.parametrize(
+        ("limit", "page_size", "src_len", "expected_len"),
+        [
+            pytest.param(30, 50, 30, 30, id="single_batch_exact_count"),
+            pytest.param(120, 50, 120, 120, id="multiple_batches"),
+            pytest.param(25, 50, 100, 25, id="limit_less_than_page_size"),
+            pytest.param(75, 50, 75, 75, id="partial_last_batch"),
+            pytest.param(100, 50, 30, 30, id="stops_when_source_exhausted"),
+            pytest.param(100, 25, 100, 100, id="custom_page_size"),
+        ],
+    )
+    def test_fetches_from_source(self, slicing_fetch, limit, page_size, src_len, expected_len):
+        """Test fetching returns items in order, batched by page_size and capped by limit."""
+        result = fetch_all_paginated(slicing_fetch(src_len), limit=limit, page_size=page_size)
+        _assert_sequential(result, expected_len)
 
     def test_empty_result(self):
         """Test fetching when source has no items."""
@@ -231,57 +250,23 @@ class TestFetchAllPaginated:
         assert result == []
         assert len(result) == 0
 
-    def test_partial_last_batch(self):
-        """Test fetching when last batch is partial."""
-        items = list(range(75))
-
-        def fetch_fn(limit, offset):
-            return items[offset : offset + limit]
-
-        result = fetch_all_paginated(fetch_fn, limit=75, page_size=50)
-        assert result == list(range(75))
-        assert len(result) == 75
-
-    def test_stops_when_source_exhausted(self):
-        """Test that fetching stops when source is exhausted before limit is reached."""
-        items = list(range(30))
-
-        def fetch_fn(limit, offset):
-            return items[offset : offset + limit]
-
-        result = fetch_all_paginated(fetch_fn, limit=100, page_size=50)
-        assert result == list(range(30))
-        assert len(result) == 30
-
-    def test_custom_page_size(self):
-        """Test fetching with custom page size."""
-        items = list(range(100))
-
-        def fetch_fn(limit, offset):
-            return items[offset : offset + limit]
-
-        result = fetch_all_paginated(fetch_fn, limit=100, page_size=25)
-        assert result == list(range(100))
-        assert len(result) == 100
-
-    def test_limits_result_to_requested_count(self):
+    def test_limits_result_to_requested_count(self, paged_items):
         """Test that result is truncated to requested limit."""
-        items = list(range(200))
 
         def fetch_fn(limit, offset):
-            return items[offset : offset + limit + 5]
+            return paged_items[offset : offset + limit + 5]
 
         result = fetch_all_paginated(fetch_fn, limit=50, page_size=50)
-        assert len(result) == 50
-        assert result == list(range(50))
+        _assert_sequential(result, 50)
 
-    def test_tracks_offset_correctly(self):
+    def test_tracks_offset_correctly(self, slicing_fetch):
         """Test that offsets are tracked correctly across batches."""
         call_log = []
+        source_fetch = slicing_fetch()
 
         def fetch_fn(limit, offset):
             call_log.append((limit, offset))
-            return list(range(offset, offset + limit))
+            return source_fetch(limit, offset)
 
         result = fetch_all_paginated(fetch_fn, limit=150, page_size=50)
 
@@ -291,14 +276,14 @@ class TestFetchAllPaginated:
         assert call_log[2] == (50, 100)
         assert len(result) == 150
 
-    def test_batch_limit_adjusted_for_final_batch(self):
+    def test_batch_limit_adjusted_for_final_batch(self, slicing_fetch):
         """Test that final batch limit is adjusted when approaching limit."""
         call_log = []
-        items = list(range(200))
+        source_fetch = slicing_fetch()
 
         def fetch_fn(limit, offset):
             call_log.append((limit, offset))
-            return items[offset : offset + limit]
+            return source_fetch(limit, offset)
 
         result = fetch_all_paginated(fetch_fn, limit=75, page_size=50)
 
@@ -307,14 +292,14 @@ class TestFetchAllPaginated:
         assert call_log[1] == (25, 50)
         assert len(result) == 75
 
-    def test_stops_on_empty_batch(self):
+    def test_stops_on_empty_batch(self, paged_items):
         """Test that fetching stops immediately on empty batch."""
         call_count = [0]
 
         def fetch_fn(limit, offset):
             call_count[0] += 1
             if offset == 0:
-                return list(range(50))
+                return paged_items[:50]
             return []
 
         result = fetch_all_paginated(fetch_fn, limit=200, page_size=50)
@@ -388,25 +373,18 @@ class TestSafeAttr:
 class TestUrlBuilders:
     """Tests for URL builder functions."""
 
-    def test_tidal_track_url(self):
-        url = tidal_track_url(12345)
-        assert url == "https://tidal.com/browse/track/12345?u"
-
-    def test_tidal_artist_url(self):
-        url = tidal_artist_url(67890)
-        assert url == "https://tidal.com/browse/artist/67890"
-
-    def test_tidal_album_url(self):
-        url = tidal_album_url(11111)
-        assert url == "https://tidal.com/browse/album/11111"
-
-    def test_tidal_playlist_url(self):
-        url = tidal_playlist_url("abc-123")
-        assert url == "https://tidal.com/playlist/abc-123"
-
-    def test_tidal_video_url(self):
-        url = tidal_video_url(99999)
-        assert url == "https://tidal.com/browse/video/99999"
+    @pytest.mark.parametrize(
+        "builder, resource_id, expected",
+        [
+            pytest.param(tidal_track_url, 12345, "https://tidal.com/browse/track/12345?u", id="track"),
+            pytest.param(tidal_artist_url, 67890, "https://tidal.com/browse/artist/67890", id="artist"),
+            pytest.param(tidal_album_url, 11111, "https://tidal.com/browse/album/11111", id="album"),
+            pytest.param(tidal_playlist_url, "abc-123", "https://tidal.com/playlist/abc-123", id="playlist"),
+            pytest.param(tidal_video_url, 99999, "https://tidal.com/browse/video/99999", id="video"),
+        ],
+    )
+    def test_url_builder(self, builder, resource_id, expected):
+        assert builder(resource_id) == expected
 
 
 class TestHandleEndpointErrors:
@@ -425,9 +403,7 @@ class TestHandleEndpointErrors:
         def failing_func():
             raise ValueError("Something went wrong")
 
-        mock_jsonify = MagicMock(side_effect=lambda x: x)
-        with patch.object(tidal_utils, "jsonify", mock_jsonify):
-            result, status = failing_func()
+        result, status = failing_func()
 
         assert status == 500
         assert "error" in result
@@ -439,9 +415,7 @@ class TestHandleEndpointErrors:
         def failing_func():
             raise RuntimeError("Network timeout")
 
-        mock_jsonify = MagicMock(side_effect=lambda x: x)
-        with patch.object(tidal_utils, "jsonify", mock_jsonify):
-            result, status = failing_func()
+        result, status = failing_func()
 
         assert "creating playlist" in result["error"]
 
@@ -450,24 +424,25 @@ class TestGetPlaylistOr404:
     """Tests for get_playlist_or_404 function."""
 
     def test_playlist_found(self):
-        mock_session = MagicMock()
-        mock_playlist = MagicMock()
-        mock_playlist.id = "test-123"
-        mock_session.playlist.return_value = mock_playlist
+        stub_playlist = SimpleNamespace(id="test-123")
+        calls = []
+
+        def fetch_playlist(playlist_id):
+            calls.append(playlist_id)
+            return stub_playlist
 
-        playlist, error = get_playlist_or_404(mock_session, "test-123")
+        session = SimpleNamespace(playlist=fetch_playlist)
 
-        assert playlist == mock_playlist
+        playlist, error = get_playlist_or_404(session, "test-123")
+
+        assert playlist is stub_playlist
         assert error is None
-        mock_session.playlist.assert_called_once_with("test-123")
+        assert calls == ["test-123"]
 
     def test_playlist_not_found(self):
-        mock_session = MagicMock()
-        mock_session.playlist.return_value = None
+        session = SimpleNamespace(playlist=lambda playlist_id: None)
 
-        mock_jsonify = MagicMock(side_effect=lambda x: x)
-        with patch.object(tidal_utils, "jsonify", mock_jsonify):
-            playlist, error = get_playlist_or_404(mock_session, "nonexistent-id")
+        playlist, error = get_playlist_or_404(session, "nonexistent-id")
 
         assert playlist is None
         assert error is not None
@@ -476,52 +451,49 @@ class TestGetPlaylistOr404:
         assert "not found" in response["error"].lower()
 
 
+@pytest.fixture
+def fake_request(monkeypatch):
+    """Stand-in for flask.request whose JSON body tests set via .body."""
+    fake = SimpleNamespace(body=None)
+    fake.get_json = lambda: fake.body
+    monkeypatch.setattr(tidal_utils, "request", fake)
+    return fake
+
+
 class TestRequireJsonBody:
     """Tests for require_json_body function."""
 
-    def test_valid_body_no_required_fields(self):
-        mock_request = MagicMock()
-        mock_request.get_json.return_value = {"key": "value"}
+    def test_valid_body_no_required_fields(self, fake_request):
+        fake_request.body = {"key": "value"}
 
-        with patch.object(tidal_utils, "request", mock_request):
-            data, error = require_json_body()
+        data, error = require_json_body()
 
         assert data == {"key": "value"}
         assert error is None
 
-    def test_valid_body_with_required_fields(self):
-        mock_request = MagicMock()
-        mock_request.get_json.return_value = {"title": "Test", "track_ids": [1, 2, 3]}
+    def test_valid_body_with_required_fields(self, fake_request):
+        fake_request.body = {"title": "Test", "track_ids": [1, 2, 3]}
 
-        with patch.object(tidal_utils, "request", mock_request):
-            data, error = require_json_body(required_fields=["title", "track_ids"])
+        data, error = require_json_body(required_fields=["title", "track_ids"])
 
         assert error is None
         assert data["title"] == "Test"
         assert data["track_ids"] == [1, 2, 3]
 
-    def test_missing_body(self):
-        mock_request = MagicMock()
-        mock_request.get_json.return_value = None
+    def test_missing_body(self, fake_request):
+        fake_request.body = None
 
-        mock_jsonify = MagicMock(side_effect=lambda x: x)
-        with patch.object(tidal_utils, "request", mock_request):
-            with patch.object(tidal_utils, "jsonify", mock_jsonify):
-                data, error = require_json_body()
+        data, error = require_json_body()
 
         assert data is None
         assert error is not None
         response, status_code = error
         assert status_code == 400
 
-    def test_missing_required_field(self):
-        mock_request = MagicMock()
-        mock_request.get_json.return_value = {"title": "Test"}
+    def test_missing_required_field(self, fake_request):
+        fake_request.body = {"title": "Test"}
 
-        mock_jsonify = MagicMock(side_effect=lambda x: x)
-        with patch.object(tidal_utils, "request", mock_request):
-            with patch.object(tidal_utils, "jsonify", mock_jsonify):
-                data, error = require_json_body(required_fields=["title", "track_ids"])
+        data, error = require_json_body(required_fields=["title", "track_ids"])
 
         assert data is None
         assert error is not None
@@ -529,14 +501,10 @@ class TestRequireJsonBody:
         assert status_code == 400
         assert "track_ids" in response["error"]
 
-    def test_empty_required_list_field(self):
-        mock_request = MagicMock()
-        mock_request.get_json.return_value = {"title": "Test", "track_ids": []}
+    def test_empty_required_list_field(self, fake_request):
+        fake_request.body = {"title": "Test", "track_ids": []}
 
-        mock_jsonify = MagicMock(side_effect=lambda x: x)
-        with patch.object(tidal_utils, "request", mock_request):
-            with patch.object(tidal_utils, "jsonify", mock_jsonify):
-                data, error = require_json_body(required_fields=["title", "track_ids"])
+        data, error = require_json_body(required_fields=["title", "track_ids"])
 
         assert data is None
         assert error is not None
@@ -544,25 +512,29 @@ class TestRequireJsonBody:
         assert status_code == 400
 
 
+class _AddablePlaylist:
+    def add(self, *args, **kwargs):
+        pass
+
+
+class _RemovablePlaylist:
+    def remove_by_id(self, *args, **kwargs):
+        pass
+
+
+class _ReadOnlyPlaylist:
+    id = "test"
+    name = "Test"
+
+
 class TestCheckUserPlaylist:
     """Tests for check_user_playlist function."""
 
     def test_playlist_with_add_capability(self):
-        mock_playlist = MagicMock()
-        mock_playlist.add = MagicMock()
-
-        error = check_user_playlist(mock_playlist, "add")
-
-        assert error is None
+        assert check_user_playlist(_AddablePlaylist(), "add") is None
 
     def test_playlist_without_add_capability(self):
-        class NoAddPlaylist:
-            id = "test"
-            name = "Test"
-
-        mock_jsonify = MagicMock(side_effect=lambda x: x)
-        with patch.object(tidal_utils, "jsonify", mock_jsonify):
-            error = check_user_playlist(NoAddPlaylist(), "add")
+        error = check_user_playlist(_ReadOnlyPlaylist(), "add")
 
         assert error is not None
         response, status_code = error
@@ -570,21 +542,10 @@ class TestCheckUserPlaylist:
         assert "Cannot modify" in response["error"]
 
     def test_playlist_with_remove_capability(self):
-        mock_playlist = MagicMock()
-        mock_playlist.remove_by_id = MagicMock()
-
-        error = check_user_playlist(mock_playlist, "remove")
-
-        assert error is None
+        assert check_user_playlist(_RemovablePlaylist(), "remove") is None
 
     def test_playlist_without_remove_capability(self):
-        class NoRemovePlaylist:
-            id = "test"
-            name = "Test"
-
-        mock_jsonify = MagicMock(side_effect=lambda x: x)
-        with patch.object(tidal_utils, "jsonify", mock_jsonify):
-            error = check_user_playlist(NoRemovePlaylist(), "remove")
+        error = check_user_playlist(_ReadOnlyPlaylist(), "remove")
 
         assert error is not None
         response, status_code = error